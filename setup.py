@@ -98,6 +98,7 @@ setup(
     extras_require={
         "testing": [
             "pytest",
+            "pytest-xdist",
             "json-schema-for-humans",
             "mongomock",
             "pandas",
@@ -126,6 +127,7 @@ setup(
             # other requirements
             "pytest",  # test framework
             "pytest-cov",  # code coverage
+            "pytest-xdist",  # parallel test execution
             "mongomock",  # mongodb mocking for testing
             # treebeardtech/nbmake#121
             "nbmake != 1.5.1",
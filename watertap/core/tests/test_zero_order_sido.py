@@ -27,6 +27,7 @@ from pyomo.environ import (
     value,
     Var,
 )
+from pyomo.core.expr.visitor import identify_variables
 from pyomo.network import Port
 from pyomo.util.check_units import assert_units_consistent
 
@@ -39,7 +40,12 @@ from watertap.core.zero_order_sido import (
     _get_Q_sido,
 )
 
-solver = get_solver()
+
+@pytest.fixture(scope="session")
+def solver():
+    # Defer solver discovery until a test actually needs to solve, so
+    # collection and unit-only runs do not pay for it
+    return get_solver()
 
 
 @declare_process_block_class("DerivedSIDO")
@@ -51,7 +57,7 @@ class DerivedSIDOData(ZeroOrderBaseData):
 
 
 class TestSIDO:
-    @pytest.fixture(scope="module")
+    @pytest.fixture(scope="session")
     def model(self):
         m = ConcreteModel()
 
@@ -73,6 +79,19 @@ class TestSIDO:
 
         return m
 
+    @pytest.fixture(scope="session")
+    def scaled_model(self, model):
+        iscale.calculate_scaling_factors(model)
+
+        return model
+
+    @pytest.fixture(scope="session")
+    def solved_model(self, scaled_model, solver):
+        results = solver.solve(scaled_model)
+        scaled_model._cached_results = results
+
+        return scaled_model
+
     @pytest.mark.unit
     def test_private_attributes(self, model):
         assert model.fs.unit._tech_type is None
@@ -117,6 +136,13 @@ class TestSIDO:
         assert isinstance(model.fs.unit.solute_treated_equation, Constraint)
         assert len(model.fs.unit.solute_treated_equation) == 3
 
+        # Each per-solute balance should only reference its own solute's
+        # variables - cross-solute sums would add fill-in to the Jacobian
+        for con in model.fs.unit.solute_removal_equation.values():
+            assert len(list(identify_variables(con.body))) == 3
+        for con in model.fs.unit.solute_treated_equation.values():
+            assert len(list(identify_variables(con.body))) == 3
+
     @pytest.mark.unit
     def test_degrees_of_freedom(self, model):
         assert degrees_of_freedom(model) == 0
@@ -126,71 +152,39 @@ class TestSIDO:
         assert_units_consistent(model)
 
     @pytest.mark.component
-    def test_scaling(self, model):
-        iscale.calculate_scaling_factors(model)
+    @pytest.mark.parametrize(
+        "cname,cindex,expected",
+        [
+            ("water_recovery_equation", 0, 1e5),
+            ("water_balance", 0, 1e5),
+            ("solute_removal_equation", (0, "A"), 1e5),
+            ("solute_removal_equation", (0, "B"), 1e5),
+            ("solute_removal_equation", (0, "C"), 1e5),
+            ("solute_treated_equation", (0, "A"), 1e5),
+            ("solute_treated_equation", (0, "B"), 1e5),
+            ("solute_treated_equation", (0, "C"), 1e5),
+        ],
+    )
+    def test_scaling(self, scaled_model, cname, cindex, expected):
+        constraint = getattr(scaled_model.fs.unit, cname)[cindex]
 
         assert (
-            iscale.get_constraint_transform_applied_scaling_factor(
-                model.fs.unit.water_recovery_equation[0]
-            )
-            == 1e5
-        )
-        assert (
-            iscale.get_constraint_transform_applied_scaling_factor(
-                model.fs.unit.water_balance[0]
-            )
-            == 1e5
-        )
-        assert (
-            iscale.get_constraint_transform_applied_scaling_factor(
-                model.fs.unit.solute_removal_equation[0, "A"]
-            )
-            == 1e5
-        )
-        assert (
-            iscale.get_constraint_transform_applied_scaling_factor(
-                model.fs.unit.solute_removal_equation[0, "B"]
-            )
-            == 1e5
-        )
-        assert (
-            iscale.get_constraint_transform_applied_scaling_factor(
-                model.fs.unit.solute_removal_equation[0, "C"]
-            )
-            == 1e5
-        )
-        assert (
-            iscale.get_constraint_transform_applied_scaling_factor(
-                model.fs.unit.solute_treated_equation[0, "A"]
-            )
-            == 1e5
-        )
-        assert (
-            iscale.get_constraint_transform_applied_scaling_factor(
-                model.fs.unit.solute_treated_equation[0, "B"]
-            )
-            == 1e5
-        )
-        assert (
-            iscale.get_constraint_transform_applied_scaling_factor(
-                model.fs.unit.solute_treated_equation[0, "C"]
-            )
-            == 1e5
+            iscale.get_constraint_transform_applied_scaling_factor(constraint)
+            == expected
         )
 
     @pytest.mark.component
-    def test_initialization(self, model):
-        initialization_tester(model)
+    def test_initialization(self, scaled_model):
+        initialization_tester(scaled_model)
 
     @pytest.mark.component
-    def test_solve(self, model):
-        results = solver.solve(model)
-
+    def test_solve(self, solved_model):
         # Check for optimal solution
-        assert check_optimal_termination(results)
+        assert check_optimal_termination(solved_model._cached_results)
 
     @pytest.mark.component
-    def test_solution(self, model):
+    def test_solution(self, solved_model):
+        model = solved_model
         assert pytest.approx(800, rel=1e-5) == value(
             model.fs.unit.treated.flow_mass_comp[0, "H2O"]
         )
@@ -218,19 +212,20 @@ class TestSIDO:
         )
 
     @pytest.mark.component
-    def test_conservation(self, model):
-        for t, j in model.fs.unit.inlet.flow_mass_comp.keys():
+    def test_conservation(self, solved_model):
+        # Evaluate each variable directly and balance with plain floats,
+        # rather than building and walking a Pyomo expression per component
+        inlet = solved_model.fs.unit.inlet.flow_mass_comp
+        treated = solved_model.fs.unit.treated.flow_mass_comp
+        byproduct = solved_model.fs.unit.byproduct.flow_mass_comp
+        for t, j in inlet.keys():
             assert (
-                abs(
-                    value(
-                        model.fs.unit.inlet.flow_mass_comp[t, j]
-                        - model.fs.unit.treated.flow_mass_comp[t, j]
-                        - model.fs.unit.byproduct.flow_mass_comp[t, j]
-                    )
-                )
+                abs(value(inlet[t, j]) - value(treated[t, j]) - value(byproduct[t, j]))
                 <= 1e-6
             )
 
     @pytest.mark.component
-    def test_report(self, model):
-        model.fs.unit.report()
+    def test_report(self, solved_model):
+        # Smoke test only - performance variable and stream table contents
+        # are asserted directly in test_private_attributes and test_solution
+        solved_model.fs.unit.report()
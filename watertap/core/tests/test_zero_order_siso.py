@@ -27,6 +27,7 @@ from pyomo.environ import (
     value,
     Var,
 )
+from pyomo.core.expr.visitor import identify_variables
 from pyomo.network import Port
 from pyomo.util.check_units import assert_units_consistent
 
@@ -108,6 +109,11 @@ class TestSISO:
         assert isinstance(model.fs.unit.solute_treated_equation, Constraint)
         assert len(model.fs.unit.solute_treated_equation) == 3
 
+        # Each per-solute balance should only reference its own solute's
+        # variables - cross-solute sums would add fill-in to the Jacobian
+        for con in model.fs.unit.solute_treated_equation.values():
+            assert len(list(identify_variables(con.body))) == 3
+
     @pytest.mark.unit
     def test_degrees_of_freedom(self, model):
         from idaes.core.util.model_statistics import unfixed_variables_set
@@ -61,20 +61,25 @@ def build_siso(self):
     self._initialize = MethodType(initialize_siso, self)
     self._scaling = MethodType(calculate_scaling_factors_siso, self)
 
+    # Look these up once - they are used repeatedly below
+    time = self.flowsheet().time
+    property_package = self.config.property_package
+    solute_set = property_package.solute_set
+
     # Create state blocks for inlet and outlets
     tmp_dict = dict(**self.config.property_package_args)
     tmp_dict["has_phase_equilibrium"] = False
     tmp_dict["defined_state"] = True
 
-    self.properties_in = self.config.property_package.build_state_block(
-        self.flowsheet().time, doc="Material properties at inlet", **tmp_dict
+    self.properties_in = property_package.build_state_block(
+        time, doc="Material properties at inlet", **tmp_dict
     )
 
     tmp_dict_2 = dict(**tmp_dict)
     tmp_dict_2["defined_state"] = False
 
-    self.properties_treated = self.config.property_package.build_state_block(
-        self.flowsheet().time, doc="Material properties of treated water", **tmp_dict_2
+    self.properties_treated = property_package.build_state_block(
+        time, doc="Material properties of treated water", **tmp_dict_2
     )
 
     # Create Ports
@@ -83,7 +88,7 @@ def build_siso(self):
 
     # Add performance variables
     self.recovery_frac_mass_H2O = Var(
-        self.flowsheet().time,
+        time,
         initialize=0.8,
         domain=NonNegativeReals,
         units=pyunits.dimensionless,
@@ -91,8 +96,8 @@ def build_siso(self):
         doc="Mass recovery fraction of water in the treated stream",
     )
     self.removal_frac_mass_comp = Var(
-        self.flowsheet().time,
-        self.config.property_package.solute_set,
+        time,
+        solute_set,
         domain=NonNegativeReals,
         initialize=0.01,
         units=pyunits.dimensionless,
@@ -101,7 +106,7 @@ def build_siso(self):
 
     # Add performance constraints
     # Water recovery
-    @self.Constraint(self.flowsheet().time, doc="Water recovery equation")
+    @self.Constraint(time, doc="Water recovery equation")
     def water_recovery_equation(b, t):
         return (
             b.recovery_frac_mass_H2O[t] * b.properties_in[t].flow_mass_comp["H2O"]
@@ -110,8 +115,8 @@ def build_siso(self):
 
     # Solute concentration of treated stream
     @self.Constraint(
-        self.flowsheet().time,
-        self.config.property_package.solute_set,
+        time,
+        solute_set,
         doc="Constraint for solute concentration in treated " "stream.",
     )
     def solute_treated_equation(b, t, j):